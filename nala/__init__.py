@@ -88,6 +88,15 @@ COLOR_CODES: dict[str, str | int] = {
 	"WHITE": 37,
 }
 
+# Build the escape sequences once instead of formatting them on every color call.
+COLOR_PREFIX: dict[str, str] = {
+	name: f"\x1b[1;{code}m"
+	for name, code in COLOR_CODES.items()
+	if name not in ("RESET", "ITALIC")
+}
+COLOR_PREFIX[""] = "\x1b[1m"
+COLOR_RESET = f"{COLOR_CODES['RESET']}"
+
 
 def color(text: object, text_color: str = "") -> str:
 	"""Return colored text if allowed."""
@@ -104,11 +113,7 @@ def color(text: object, text_color: str = "") -> str:
 
 def color_text(text: object, text_color: str = "") -> str:
 	"""Return bold text in the color of your choice."""
-	return (
-		f"\x1b[1;{COLOR_CODES[text_color]}m{text}{COLOR_CODES['RESET']}"
-		if text_color
-		else f"\x1b[1m{text}{COLOR_CODES['RESET']}"
-	)
+	return f"{COLOR_PREFIX[text_color]}{text}{COLOR_RESET}"
 
 
 def color_version(version: str) -> str:
@@ -119,8 +124,14 @@ def color_version(version: str) -> str:
 
 
 translate = gettext.translation("nala", fallback=True)
+# Without a catalog every lookup returns the message unchanged,
+# so skip building the console options just to decide that.
+NO_TRANSLATION = type(translate) is gettext.NullTranslations
+gettext_lookup = translate.gettext
 
 
 def _(msg: str) -> str:
 	"""Gettext translator."""
-	return msg if console.options.ascii_only else translate.gettext(msg)
+	if NO_TRANSLATION or console.options.ascii_only:
+		return msg
+	return gettext_lookup(msg)
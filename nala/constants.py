@@ -165,6 +165,16 @@ DPKG_ERRORS = (
 	b"Errors were encountered while processing",
 	b"Processing was halted because there were too many errors",
 )
+# Each of these is checked on every line of dpkg output.
+# A single alternation scans the line once instead of once per message.
+NOTICES_PATTERN = re.compile(b"|".join(re.escape(notice) for notice in NOTICES))
+SPAM_PATTERN = re.compile("|".join(re.escape(spam) for spam in SPAM))
+DPKG_STATUS_PATTERN = re.compile(
+	b"|".join(re.escape(status) for status in DPKG_STATUS)
+)
+DPKG_ERRORS_PATTERN = re.compile(
+	b"|".join(re.escape(error) for error in DPKG_ERRORS)
+)
 CAT = r"""
    |\---/|
    | ,_, |
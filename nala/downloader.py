@@ -703,9 +703,13 @@ def post_download_check(url: URL) -> bool:
 def check_hash(url: URL) -> bool:
 	"""Check hash value."""
 	hash_fun = hashlib.new(url.hash_type)
-	with url.path.open("rb") as file:
-		while data := file.read(4096):
-			hash_fun.update(data)
+	# Reuse one buffer for the whole file so large debs are hashed
+	# in few reads without allocating a new bytes object for every chunk.
+	buffer = bytearray(1024 * 1024)
+	view = memoryview(buffer)
+	with url.path.open("rb", buffering=0) as file:
+		while size := file.readinto(buffer):
+			hash_fun.update(view[:size])
 
 	received = hash_fun.hexdigest()
 	url.dprint(received)
@@ -799,17 +803,14 @@ def versions_to_urls(versions: Iterable[Version]) -> list[URLSet]:
 	mirrors: dict[str, list[str]] = {}
 	for version in versions:
 		url_set = URLSet()
-		for uri in filter_uris(version, mirrors, untrusted):
+		if uris := list(filter_uris(version, mirrors, untrusted)):
+			# These are the same for every uri of the version, only look them up once.
 			hash_type, hashsum = get_hash(version)
-			url_set.append(
-				URL(
-					uri,
-					version.size,
-					# Have to run the filename through a path to get the last section
-					ARCHIVE_DIR / get_pkg_name(version),
-					hash_type=hash_type,
-					hash=hashsum,
-				)
+			size = version.size
+			# Have to run the filename through a path to get the last section
+			path = ARCHIVE_DIR / get_pkg_name(version)
+			url_set.extend(
+				URL(uri, size, path, hash_type=hash_type, hash=hashsum) for uri in uris
 			)
 		urls.append(url_set)
 
@@ -833,8 +834,9 @@ def filter_uris(
 		# Regex to check if we're using mirror://
 		if regex := MIRROR_PATTERN.search(uri):
 			set_mirrors_txt(domain := regex.group(1), mirrors)
+			filename = candidate.filename
 			yield from (
-				link + candidate.filename
+				link + filename
 				for link in mirrors[domain]
 				if not link.startswith("#")
 			)
@@ -850,8 +852,9 @@ def filter_uris(
 					Path(regex.group(1)).read_text(encoding="utf-8").splitlines()
 				)
 
+			filename = candidate.filename
 			yield from (
-				f"{link}/{candidate.filename}"
+				f"{link}/{filename}"
 				for link in mirrors[regex.group(1)]
 				if not link.startswith("#")
 			)
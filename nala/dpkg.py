@@ -30,11 +30,13 @@ import fcntl
 import os
 import pty
 import re
+import select
 import signal
 import struct
 import sys
 import termios
-from time import sleep, time
+from collections import deque
+from time import monotonic, sleep, time
 from traceback import format_exception
 from types import FrameType
 from typing import Match, TextIO
@@ -42,17 +44,16 @@ from typing import Match, TextIO
 import apt_pkg
 from apt.progress import base, text
 from pexpect.fdpexpect import fdspawn
-from pexpect.utils import poll_ignore_interrupts
 from ptyprocess.ptyprocess import _setwinsize
 
 from nala import _, color
 from nala.constants import (
-	DPKG_ERRORS,
-	DPKG_STATUS,
+	DPKG_ERRORS_PATTERN,
+	DPKG_STATUS_PATTERN,
 	ERROR_PREFIX,
 	HANDLER,
-	NOTICES,
-	SPAM,
+	NOTICES_PATTERN,
+	SPAM_PATTERN,
 	WARNING_PREFIX,
 )
 from nala.options import arguments
@@ -65,6 +66,7 @@ from nala.rich import (
 	RenderableType,
 	Table,
 	TaskID,
+	Text,
 	Thread,
 	ascii_replace,
 	dpkg_progress,
@@ -75,7 +77,9 @@ from nala.rich import (
 from nala.utils import dprint, eprint, term, unit_str
 
 VERSION_PATTERN = re.compile(r"\(.*?\)")
-PARENTHESIS_PATTERN = re.compile(r"[()]")
+POLL_EVENTS = select.POLLIN | select.POLLPRI | select.POLLHUP | select.POLLERR
+# Redraw the scroll bar at most this often, lines in between are rendered together.
+SCROLL_INTERVAL = 1 / 15
 
 notice: list[str] = []
 pkgnames: set[str] = set()
@@ -93,6 +97,9 @@ UPDATED = _("Updated:")
 DOWNLOADED = _("Downloaded:")
 IGNORED = _("Ignored:")
 NO_CHANGE = _("No Change:")
+UPDATE_STATUS_PATTERN = re.compile(
+	"|".join(re.escape(status) for status in (UPDATED, DOWNLOADED, IGNORED, NO_CHANGE))
+)
 
 # NOTE: Spacing of following status messages
 # NOTE: is to allow the urls to be properly aligned
@@ -201,23 +208,23 @@ class UpdateProgress(text.AcquireProgress):
 			self.apt_write(msg, newline, maximize)
 			return
 
-		for item in (UPDATED, DOWNLOADED, IGNORED, NO_CHANGE):
-			if item in msg:
-				self.table_print(msg, update_spinner=True)
-				break
-		else:
-			if FETCHED in msg:
-				self.table_print(msg, fetched=True)
-				return
+		# One scan for all of the item status headers
+		if UPDATE_STATUS_PATTERN.search(msg):
+			self.table_print(msg, update_spinner=True)
+			return
 
-			if ERROR_PREFIX in msg:
-				for line in msg.splitlines():
-					update_error.append(line)
-					eprint(line)
-				return
+		if FETCHED in msg:
+			self.table_print(msg, fetched=True)
+			return
+
+		if ERROR_PREFIX in msg:
+			for line in msg.splitlines():
+				update_error.append(line)
+				eprint(line)
+			return
 
-			spinner.text = from_ansi(msg)
-			self.table_print(update_spinner=True)
+		spinner.text = from_ansi(msg)
+		self.table_print(update_spinner=True)
 
 	def table_print(
 		self, msg: str = "", fetched: bool = False, update_spinner: bool = False
@@ -285,6 +292,7 @@ class UpdateProgress(text.AcquireProgress):
 			buf = fcntl.ioctl(self._file, termios.TIOCGWINSZ, 8 * b" ")
 			dummy, columns, dummy, dummy = struct.unpack("hhhh", buf)
 			self._width = columns - 1  # 1 for the cursor
+		self.live.update_size()
 
 	def start(self) -> None:
 		"""Start an Acquire progress.
@@ -424,6 +432,7 @@ class InstallProgress(base.InstallProgress):
 
 	def finish_update(self) -> None:
 		"""Call when update has finished."""
+		self.flush_logs()
 		if not arguments.raw_dpkg:
 			dpkg_progress.advance(self.task)
 			self.live.scroll_bar()
@@ -434,6 +443,8 @@ class InstallProgress(base.InstallProgress):
 		returns the result of calling `obj.do_install()`
 		"""
 		dprint("Forking")
+		# Anything still buffered would be written twice once the child exits.
+		self.flush_logs()
 		pid, self.child_fd = fork()
 		if pid == 0:
 			try:
@@ -445,6 +456,7 @@ class InstallProgress(base.InstallProgress):
 					# pylint: disable=subprocess-run-check
 					self.dpkg_log("Command Execution:\n")
 					self.dpkg_log(f"Command = {apt}\n\n")
+					self.flush_logs()
 					os._exit(
 						os.spawnlp(  # nosec
 							os.P_WAIT,
@@ -458,6 +470,7 @@ class InstallProgress(base.InstallProgress):
 					)
 				# We ignore this with mypy because the attr is there
 				self.dpkg_log("Apt Do Install\n\n")
+				self.flush_logs()
 				os._exit(apt.do_install(self.write_stream.fileno()))  # type: ignore[attr-defined]
 			# We need to catch every exception here.
 			# If we don't the code continues in the child,
@@ -465,6 +478,7 @@ class InstallProgress(base.InstallProgress):
 			except Exception:  # pylint: disable=broad-except
 				exception = format_exception(*sys.exc_info())
 				self.dpkg_log(f"{exception}\n")
+				self.flush_logs()
 				os._exit(1)
 
 		dprint("Dpkg Forked")
@@ -475,6 +489,8 @@ class InstallProgress(base.InstallProgress):
 		# But we also subclass it to give it the interact method and setwindow
 		self.child = AptExpect(self.child_fd, timeout=None)
 
+		# A resize between UpdateProgress.stop and here had no handler, refresh the size.
+		self.live.update_size()
 		signal.signal(signal.SIGWINCH, self.sigwinch_passthrough)
 		self.child.interact(self)
 		return os.WEXITSTATUS(self.wait_child())
@@ -483,38 +499,38 @@ class InstallProgress(base.InstallProgress):
 		self, _sig_dummy: int, _data_dummy: FrameType | None
 	) -> None:
 		"""Pass through sigwinch signals to dpkg."""
-		buffer = struct.pack("HHHH", 0, 0, 0, 0)
-		term_size = struct.unpack(
-			"hhhh", fcntl.ioctl(term.STDIN, termios.TIOCGWINSZ, buffer)
-		)
+		self.live.update_size()
+		columns, lines = os.get_terminal_size(term.STDIN)
 		if self.child.isalive():
 			with contextlib.suppress(ValueError):
-				_setwinsize(self.child_fd, term_size[0], term_size[1])
+				_setwinsize(self.child_fd, lines, columns)
 
 	def dpkg_log(self, msg: str) -> None:
-		"""Write to dpkg-debug.log and flush."""
+		"""Write to dpkg-debug.log."""
 		self._dpkg_log.write(msg)
-		self._dpkg_log.flush()
 
-	def term_log(self, msg: bytes) -> None:
-		"""Write to term.log and flush."""
-		self._term_log.write(f"{msg.decode('utf-8').strip()}\n")
+	def term_log(self, msg: str) -> None:
+		"""Write to term.log."""
+		self._term_log.write(f"{msg.strip()}\n")
+
+	def flush_logs(self) -> None:
+		"""Flush the buffered log files to disk."""
+		self._dpkg_log.flush()
 		self._term_log.flush()
 
 	def dpkg_status(self, data: bytes) -> bool:
 		"""Handle any status messages."""
-		for status in DPKG_STATUS:
-			if status in data:
-				statuses = data.split(b"\r")
-				if len(statuses) > 2:
-					self.dpkg_log(f"Status_Split = {repr(statuses)}\n")
-				for msg in statuses:
-					if msg != b"":
-						spinner.text = from_ansi(color(msg.decode().strip()))
-						self.live.scroll_bar(update_spinner=True)
-				self.dpkg_log(term.LF.decode())
-				return True
-		return False
+		if not DPKG_STATUS_PATTERN.search(data):
+			return False
+		statuses = data.split(b"\r")
+		if len(statuses) > 2 and arguments.debug:
+			self.dpkg_log(f"Status_Split = {repr(statuses)}\n")
+		for msg in statuses:
+			if msg != b"":
+				spinner.text = from_ansi(color(msg.decode().strip()))
+				self.live.scroll_bar(update_spinner=True)
+		self.dpkg_log("\n")
+		return True
 
 	def read_status(self) -> None:
 		"""Read the status fd and send it to update progress bar."""
@@ -589,7 +605,8 @@ class InstallProgress(base.InstallProgress):
 			os.write(self.child_fd, term.CRLF)
 
 		# Save Term and Alt Screen for debconf and Bracked Paste for the start of the shell
-		if (
+		# All three are escape sequences, so plain dpkg output is rejected with one scan.
+		if term.ESCAPE in data and (
 			term.SAVE_TERM in data
 			or term.ENABLE_BRACKETED_PASTE in data
 			or term.ENABLE_ALT_SCREEN in data
@@ -605,13 +622,15 @@ class InstallProgress(base.InstallProgress):
 	def format_dpkg_output(self, rawline: bytes) -> None:
 		"""Facilitate what needs to happen to dpkg output."""
 		# If we made it here that means we're okay to start a new line in the log
-		self.dpkg_log(term.LF.decode())
+		self.dpkg_log("\n")
 
 		if self.raw:
 			self.rawline_handler(rawline)
 			return
 
-		line = ascii_replace(rawline.decode().strip())
+		# Decode once, everything below works on the text.
+		decoded = rawline.decode()
+		line = ascii_replace(decoded.strip())
 
 		if check_line_spam(line, rawline, self.last_line):
 			return
@@ -623,18 +642,20 @@ class InstallProgress(base.InstallProgress):
 		):
 			self.advance_progress()
 
-		self.term_log(rawline)
+		self.term_log(decoded)
 
 		# We need to split up large lines and handle them individually.
-		if rawline.count(b"\r\n") > 1:
-			data_split = rawline.strip().split(b"\r\n")
-			error = data_split[0].decode() in dpkg_error
-			self.dpkg_log(f"Data_Split = {repr(data_split)}\n")
+		if decoded.count("\r\n") > 1:
+			data_split = decoded.strip().split("\r\n")
+			error = data_split[0] in dpkg_error
+			if arguments.debug:
+				# This is the same data as the Raw entry, just split up.
+				self.dpkg_log(f"Data_Split = {repr(data_split)}\n")
 			for new_line in data_split:
 				if not new_line:
 					continue
-				check_error(rawline, new_line.decode(), error)
-				self.format_write(new_line.decode(), rawline)
+				check_error(rawline, new_line, error)
+				self.format_write(new_line, rawline)
 			return
 		self.format_write(line, rawline)
 
@@ -702,15 +723,14 @@ class InstallProgress(base.InstallProgress):
 
 def check_line_spam(line: str, rawline: bytes, last_line: bytes) -> bool:
 	"""Check for, and handle, notices and spam."""
-	for message in NOTICES:
-		if message in rawline and line not in notice:
-			notice.append(line)
-			return False
+	if NOTICES_PATTERN.search(rawline) and line not in notice:
+		notice.append(line)
+		return False
 	if b"but it can still be activated by:" in last_line:
 		notice.append(f"  {line}")
 		return False
 
-	return any(item in line for item in SPAM)
+	return bool(SPAM_PATTERN.search(line))
 
 
 def check_error(data: bytes, line: str, error_in_list: bool = False) -> None:
@@ -718,15 +738,9 @@ def check_error(data: bytes, line: str, error_in_list: bool = False) -> None:
 	# Check so we don't duplicate error messages
 	if error_in_list:
 		return
-	for error in DPKG_ERRORS:
-		# Make sure that the error is not spam
-		if error in data and all(item not in line for item in SPAM):
-			dpkg_error.append(line)
-
-
-def paren_color(match: Match[str]) -> str:
-	"""Color parenthesis."""
-	return color("(") if match.group(0) == "(" else color(")")
+	# Make sure that the error is not spam
+	if DPKG_ERRORS_PATTERN.search(data) and not SPAM_PATTERN.search(line):
+		dpkg_error.append(line)
 
 
 def line_replace(line: str, header: str) -> str:
@@ -734,36 +748,13 @@ def line_replace(line: str, header: str) -> str:
 	return line.replace(header, "").strip()
 
 
-def format_version(match: list[str], line: str) -> str:
+def format_version(match: Match[str]) -> str:
 	"""Format version numbers."""
-	for ver in match:
-		version = ver[1:-1]
-		if version and version[0].isdigit():
-			new_ver = ver.replace(version, color(version, "BLUE"))
-			new_ver = re.sub(PARENTHESIS_PATTERN, paren_color, new_ver)
-			line = line.replace(ver, new_ver)
-	return line
-
-
-def fill_pulse(pulse: list[str]) -> str:
-	"""Fill the pulse message."""
-	last = len(pulse) - 1
-	fill = sum(len(line) for line in pulse) + last
-	# Set fill width to fit inside the rich panel
-	fill = (term.columns - fill) - 5 if arguments.verbose else (term.columns - fill) - 7
-	# Minus 2 more to account for ascii simpleDots on the spinner
-	if term.console.options.ascii_only:
-		fill -= 2
-	# Make sure we insert the filler in the right spot
-	# In case of extra 1 min as shown below.
-	# ['2407', 'kB/s', '30s']
-	# ['895', 'kB/s', '1min', '18s']
-	index = last - 2
-	if "/s" in pulse[index]:
-		index = last - 3
-
-	pulse.insert(index, " " * fill)
-	return " ".join(pulse)
+	ver = match.group(0)
+	version = ver[1:-1]
+	if version and version[0].isdigit():
+		return f"{color('(')}{color(version, 'BLUE')}{color(')')}"
+	return ver
 
 
 def msg_formatter(line: str) -> str:
@@ -790,9 +781,8 @@ def msg_formatter(line: str) -> str:
 	elif line.startswith(GET):
 		line = f"{color(f'{FETCHED}:', 'BLUE')} {' '.join(line.split()[1:])}"
 
-	if match := re.findall(VERSION_PATTERN, line):
-		return format_version(match, line)
-	return line
+	# Color every version in one pass over the line.
+	return VERSION_PATTERN.sub(format_version, line)
 
 
 class DpkgLive(Live):
@@ -802,9 +792,15 @@ class DpkgLive(Live):
 		"""Subclass for dpkg live display."""
 		super().__init__(auto_refresh=False, refresh_per_second=4)
 		self.install = install
-		self.scroll_list: list[str] = []
+		self.columns: int
+		self.lines: int
+		# The size only changes on SIGWINCH, don't ask the terminal on every redraw.
+		self.update_size()
+		self.scroll_list: deque[Text] = deque(maxlen=self.scroll_size())
 		self.scroll_config = (False, False, True)
 		self.used_scroll: bool = False
+		self.last_render = 0.0
+		self.pending = False
 
 	def __enter__(self) -> DpkgLive:
 		"""Start the live display."""
@@ -828,15 +824,23 @@ class DpkgLive(Live):
 			self.used_scroll = True
 			self.scroll_config = (apt_fetch, update_spinner, use_bar)
 
-		if msg:
-			self.scroll_list.append(msg)
 		self.slice_list()
+		if msg:
+			# Decode the ansi once here instead of for every line on every redraw.
+			self.scroll_list.append(from_ansi(msg))
+
+		now = monotonic()
+		if not rerender and now - self.last_render < SCROLL_INTERVAL:
+			self.pending = True
+			return
+		self.pending = False
+		self.last_render = now
 
 		table = Table.grid()
-		table.add_column(no_wrap=True, width=term.columns, overflow=OVERFLOW)
+		table.add_column(no_wrap=True, width=self.columns, overflow=OVERFLOW)
 
 		for item in self.scroll_list:
-			table.add_row(from_ansi(item))
+			table.add_row(item)
 
 		if use_bar or update_spinner:
 			table.add_row(
@@ -901,13 +905,25 @@ class DpkgLive(Live):
 
 		return dpkg_progress.get_renderable()
 
+	def update_size(self) -> None:
+		"""Store the current terminal size."""
+		self.columns = term.columns
+		self.lines = term.lines
+
+	def scroll_size(self) -> int:
+		"""Return how many lines the scroll bar can hold."""
+		return max(self.lines // 2, 10)
+
 	def slice_list(self) -> None:
 		"""Set scroll bar to take up only 1/2 of the screen."""
-		scroll_lines = term.lines // 2
-		size = len(self.scroll_list)
-		if size > scroll_lines and size > 10:
-			total = size - max(scroll_lines, 10)
-			self.scroll_list = self.scroll_list[total:]
+		# The deque drops old lines on its own, we only rebuild it if the terminal resized.
+		if (size := self.scroll_size()) != self.scroll_list.maxlen:
+			self.scroll_list = deque(self.scroll_list, maxlen=size)
+
+	def flush(self) -> None:
+		"""Render the scroll bar if an update was held back."""
+		if self.pending:
+			self.scroll_bar(rerender=True)
 
 	def raw_init(self) -> None:
 		"""Set up the live display to be stopped."""
@@ -917,9 +933,16 @@ class DpkgLive(Live):
 			self._refresh_thread = None
 
 		# We update the live display to blank before stopping it
+		self.pending = False
 		self.update("", refresh=True)
 		self.stop()
 
+	def stop(self) -> None:
+		"""Stop live rendering display."""
+		if self._started:
+			self.flush()
+		super().stop()
+
 	def start(self, refresh: bool = False) -> None:
 		"""Start live rendering display.
 
@@ -931,6 +954,8 @@ class DpkgLive(Live):
 		with self._lock:
 			if self._started:
 				return
+			# We may have been resized while stopped for a conf prompt.
+			self.update_size()
 			self.console.set_live(self)
 			self._started = True
 			if self._screen:
@@ -975,9 +1000,23 @@ class AptExpect(fdspawn):  # type: ignore[misc]
 
 	def interact_copy(self, install_progress: InstallProgress) -> None:
 		"""Interact with the pty."""
+		# Register the descriptors once instead of building a new poll set every loop.
+		poller = select.poll()
+		for fd in (self.child_fd, term.STDIN):
+			poller.register(fd, POLL_EVENTS)
+		live = install_progress.live
 		while self.isalive():
 			try:
-				ready = poll_ignore_interrupts([self.child_fd, term.STDIN])
+				# If the scroll bar is holding back lines don't wait on dpkg forever.
+				ready = [
+					fd
+					for fd, _event in poller.poll(
+						SCROLL_INTERVAL * 1000 if live.pending else None
+					)
+				]
+				if not ready:
+					live.flush()
+					continue
 				if self.child_fd in ready and not self._read(install_progress):
 					break
 				if term.STDIN in ready:
@@ -1010,11 +1049,13 @@ class AptExpect(fdspawn):  # type: ignore[misc]
 
 	def _write(self, install_progress: InstallProgress) -> None:
 		"""Write user inputs into the pty."""
-		data = os.read(term.STDIN, 1000)
+		data = memoryview(os.read(term.STDIN, 4096))
 		# Term up and clear in case we answer a question. This stops some live window artifacts.
 		# We need to not do this if we're in raw mode or else it breaks things.
 		if not install_progress.raw:
 			term.write((term.CURSER_UP + term.CLEAR_LINE) * 2)
-		while data != b"" and self.isalive():
-			split = os.write(self.child_fd, data)
-			data = data[split:]
+		if not self.isalive():
+			return
+		# Slicing the view on a partial write doesn't copy the rest of the input.
+		while data:
+			data = data[os.write(self.child_fd, data) :]
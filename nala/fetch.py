@@ -63,8 +63,6 @@ from nala.options import ASSUME_YES, DEBUG, MAN_HELP, VERBOSE, arguments, nala
 from nala.rich import ELLIPSIS, Live, Panel, Table, fetch_progress
 from nala.utils import ask, dprint, eprint, sudo_check, term
 
-from debian.deb822 import Deb822  # isort:skip
-
 DEBIAN = "Debian"
 UBUNTU = "Ubuntu"
 DEVUAN = "Devuan"
@@ -223,9 +221,9 @@ class FetchLive:
 	) -> None:
 		"""Generate the mirror list for display."""
 		index = 0
+		existing = existing_uris(release, sources)
 		for line in netselect_scored:
-			url = line[line.index(":") :].rstrip("/")
-			if any(url in mirror and release in mirror for mirror in sources):
+			if line[line.index(":") :].rstrip("/") in existing:
 				continue
 
 			self.mirror_list[index] = line
@@ -605,6 +603,9 @@ def detect_release(
 
 def parse_sources() -> list[str]:
 	"""Read sources files on disk."""
+	# deb822 is only needed here, don't pay for it on every nala command.
+	from debian.deb822 import Deb822  # pylint: disable=import-outside-toplevel
+
 	sources: list[str] = []
 	for file in [*SOURCEPARTS.iterdir(), SOURCELIST]:
 		if (
@@ -640,6 +641,17 @@ def parse_sources() -> list[str]:
 	return sources
 
 
+def existing_uris(release: str, sources: Iterable[str]) -> set[str]:
+	"""Return the scheme agnostic uris already configured for the release."""
+	return {
+		word[word.index(":") :].rstrip("/")
+		for mirror in sources
+		if release in mirror
+		for word in mirror.split()
+		if "://" in word
+	}
+
+
 def gen_table(str_list: dict[int, str]) -> Table:
 	"""Generate table for the live display."""
 	master_table = Table(padding=(0, 0), box=None)
@@ -733,11 +745,12 @@ def build_sources(  # pylint: disable=too-many-arguments
 	"""Build the sources file and return it as a string."""
 	source = "# Sources file built for nala\n\n"
 	num = 0
+	existing = existing_uris(release, sources)
 	for line in netselect_scored:
 		# This splits off the score '030 http://mirror.steadfast.net/debian/'
 		line = line[line.index("h") :]
 		# This protects us from writing mirrors that we already have in the sources
-		if any(line.rstrip("/") in mirror and release in mirror for mirror in sources):
+		if line[line.index(":") :].rstrip("/") in existing:
 			continue
 
 		deb_entry = (
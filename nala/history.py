@@ -30,7 +30,7 @@ from getpass import getuser
 from json.decoder import JSONDecodeError
 from os import environ, getuid
 from pwd import getpwnam
-from typing import Dict, Generator, Iterable, List, Tuple, Union, cast
+from typing import Dict, Generator, List, Tuple, Union, cast
 
 import typer
 from apt.package import Package
@@ -97,7 +97,7 @@ def load_history_file() -> HistoryFile:
 	try:
 		return cast(
 			HistoryFile,
-			json.loads(NALA_HISTORY.read_text(encoding="utf-8")),
+			json.loads(NALA_HISTORY.read_bytes()),
 		)
 	except JSONDecodeError:
 		sys.exit(
@@ -119,9 +119,11 @@ def write_history_file(data: HistoryFile) -> None:
 def get_history(hist_id: str) -> HistoryEntry:
 	"""Get the history from file."""
 	dprint(f"Getting History Entry: {hist_id}")
-	if not NALA_HISTORY.exists():
+	try:
+		history_file = load_history_file()
+	except FileNotFoundError:
 		sys.exit(_("{error} No history exists.").format(error=ERROR_PREFIX))
-	if transaction := load_history_file().get(hist_id):
+	if transaction := history_file.get(hist_id):
 		return transaction
 	sys.exit(
 		_("{error} Transaction {num} doesn't exist.").format(
@@ -215,7 +217,10 @@ def set_user_installed(
 
 def write_history(cache: Cache, handler: PackageHandler, operation: str) -> None:
 	"""Prepare history for writing."""
-	history_dict = load_history_file() if NALA_HISTORY.exists() else {}
+	try:
+		history_dict = load_history_file()
+	except FileNotFoundError:
+		history_dict = {}
 	nala_dict = pop_nala(history_dict)
 	user_installed = set(get_list(nala_dict, "User-Installed"))
 
@@ -280,9 +285,10 @@ def write_history(cache: Cache, handler: PackageHandler, operation: str) -> None
 
 def hist_id_completion() -> Generator[Tuple[str, str], None, None]:
 	"""Complete history ID arguments."""
-	if not NALA_HISTORY.exists():
+	try:
+		history_file = load_history_file()
+	except FileNotFoundError:
 		return
-	history_file = load_history_file()
 	pop_nala(history_file)
 	for key, entry in history_file.items():
 		if (command := get_list(entry, "Command"))[0] in ("update", "upgrade"):
@@ -317,30 +323,12 @@ def history_summary(
 	if ctx.invoked_subcommand:
 		return
 
-	if not NALA_HISTORY.exists():
+	try:
+		history_file = load_history_file()
+	except FileNotFoundError:
 		sys.exit(_("{error} No history exists.").format(error=ERROR_PREFIX))
-	history_file = load_history_file()
 	pop_nala(history_file)
 
-	names: list[Iterable[str]] = []
-
-	for key, entry in history_file.items():
-		dprint(f"History ID {key}")
-		if (command := get_list(entry, "Command"))[0] in ("update", "upgrade"):
-			command.extend(pkg.name for pkg in get_nala_packages(entry, "Upgraded"))
-
-		names.append(
-			(
-				key,
-				" ".join(command),
-				get_str(entry, "Date"),
-				get_str(entry, "Altered"),
-				get_str(entry, "Requested-By"),
-			)
-		)
-	if not names:
-		sys.exit(_("{error} No history exists.").format(error=ERROR_PREFIX))
-
 	max_width = term.columns - 69
 	history_table = Table(
 		Column("ID"),
@@ -352,8 +340,22 @@ def history_summary(
 		box=None,
 	)
 
-	for item in names:
-		history_table.add_row(*item)
+	for key, entry in history_file.items():
+		dprint(f"History ID {key}")
+		if (command := get_list(entry, "Command"))[0] in ("update", "upgrade"):
+			# Only the names are shown, no need to build full NalaPackages
+			command.extend(pkg[0] for pkg in get_packages(entry, "Upgraded"))
+
+		history_table.add_row(
+			key,
+			" ".join(command),
+			get_str(entry, "Date"),
+			get_str(entry, "Altered"),
+			get_str(entry, "Requested-By"),
+		)
+	if not history_table.row_count:
+		sys.exit(_("{error} No history exists.").format(error=ERROR_PREFIX))
+
 	term.console.print(history_table)
 
 
@@ -431,11 +433,13 @@ def history_clear(
 	"""Clear a transaction or the entire history."""
 	hist_id = f"{_hist_id}"
 	dprint(f"History clear {hist_id}")
-	if not NALA_HISTORY.exists():
+	try:
+		history_file = load_history_file()
+	except FileNotFoundError:
 		eprint(_("No history exists to clear") + ELLIPSIS)
 		return
 
-	if hist_id not in (history_file := load_history_file()).keys():
+	if hist_id not in history_file.keys():
 		sys.exit(
 			_("{error} ID: {hist_id} does not exist in the history").format(
 				error=ERROR_PREFIX, hist_id=color(hist_id, "YELLOW")
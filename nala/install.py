@@ -39,7 +39,7 @@ import apt_pkg
 from apt.cache import FetchFailedException, LockFailedException
 from apt.package import BaseDependency, Dependency, Package, Version
 from apt_pkg import DepCache, Error as AptError, get_architectures
-from httpx import HTTPError, head
+from httpx import Client, HTTPError
 
 from nala import _, color, color_version
 from nala.cache import Cache
@@ -104,10 +104,13 @@ def auto_remover(cache: Cache, nala_pkgs: PackageHandler, config: bool = False)
 		"autopurge",
 	):
 		dprint("Packages will not be autoremoved")
+		# pkg.installed builds a new Version each access, only look it up once.
 		nala_pkgs.not_needed = [
-			NalaPackage(pkg.name, pkg.installed.version, pkg.installed.installed_size)
+			NalaPackage(pkg.name, installed.version, installed.installed_size)
 			for pkg in cache
-			if pkg.installed and not pkg.marked_delete and pkg.is_auto_removable
+			if (installed := pkg.installed)
+			and not pkg.marked_delete
+			and pkg.is_auto_removable
 		]
 		return
 
@@ -162,14 +165,18 @@ def recurse_deps(
 	for _ in range(levels):
 		dep_list: set[Package] = set()
 		for dpkg in pkgs:
-			dependencies = get_dep_type(dpkg, installed)
-			for deps in dependencies:
+			for deps in get_dep_type(dpkg, installed):
 				# deps len greater than 1 are or_deps
 				if len(deps) > 1:
 					for ndep in deps:
 						dep_list |= get_dep_pkgs(ndep, installed)
 					continue
 				dep_list |= get_dep_pkgs(deps[0], installed)
+		# Only walk packages we haven't seen yet on the next level.
+		# Shared dependencies would otherwise be expanded again every level.
+		dep_list -= total_deps
+		if not dep_list:
+			break
 		total_deps |= dep_list
 		pkgs = dep_list
 	dprint(
@@ -340,6 +347,8 @@ def apt_hook_with_pkgs(cache: Cache) -> None:
 	apt_hooks = apt_pkg.config.value_list("DPkg::Pre-Install-Pkgs")
 	# Remove the hooks so that apt doesn't also run them.
 	apt_pkg.config.clear("DPkg::Pre-Install-Pkgs")
+	# get_changes walks the whole cache, every hook gets the same changes.
+	changes = cache.get_changes() if any(apt_hooks) else []
 
 	for hook in apt_hooks:
 		if not hook:
@@ -357,7 +366,7 @@ def apt_hook_with_pkgs(cache: Cache) -> None:
 		# Setup package information
 		pkgs: list[str] = []
 
-		for pkg in cache.get_changes():
+		for pkg in changes:
 			if version <= 1:
 				# Only deal with packages marked install or upgraded
 				if not (pkg.marked_install or pkg.marked_upgrade):
@@ -694,10 +703,10 @@ def prioritize_local(
 	pkg_names.remove(cache_name)
 
 
-def get_url_size(url: str) -> int:
+def get_url_size(url: str, client: Client) -> int:
 	"""Get the URL Header and check for content length."""
 	# We must get the headers so we know what the filesize is.
-	response = head(url, follow_redirects=True)
+	response = client.head(url, follow_redirects=True)
 	response.raise_for_status()
 	dprint(response.headers)
 
@@ -712,7 +721,7 @@ def get_url_size(url: str) -> int:
 		)
 
 
-def split_url(url_string: str, cache: Cache) -> URLSet:
+def split_url(url_string: str, cache: Cache, client: Client) -> URLSet:
 	"""Split the URL and try to determine the hash."""
 	dprint(url_split := url_string.split(":"))
 
@@ -727,7 +736,7 @@ def split_url(url_string: str, cache: Cache) -> URLSet:
 	# Initialize a URL
 	url = URL(
 		f"{proto}:{body}",
-		get_url_size(f"{proto}:{body}"),
+		get_url_size(f"{proto}:{body}", client),
 		ARCHIVE_DIR / filename,
 		proto,
 	)
@@ -843,17 +852,19 @@ def split_local(
 	download_debs = []
 	if urls := [name for name in pkg_names if name.startswith(("http://", "https://"))]:
 		print(f"Checking Urls{ELLIPSIS}")
-		for url in urls:
-			try:
-				vprint(f"Verifying {url}")
-				url_set = split_url(url, cache)
-			except HTTPError as error:
-				print_error(error)
-				sys.exit(1)
+		# Share one client so urls on the same host reuse the connection.
+		with Client() as client:
+			for url in urls:
+				try:
+					vprint(f"Verifying {url}")
+					url_set = split_url(url, cache, client)
+				except HTTPError as error:
+					print_error(error)
+					sys.exit(1)
 
-			download_debs.append(url_set)
-			pkg_names.remove(url)
-			pkg_names.append(f"{url_set.path()}")
+				download_debs.append(url_set)
+				pkg_names.remove(url)
+				pkg_names.append(f"{url_set.path()}")
 
 	# .deb packages have to be downloaded before anything else in order to determine dependencies
 	if download_debs:
@@ -886,47 +897,48 @@ def split_local(
 
 def package_manager(pkg_names: list[str], cache: Cache, remove: bool = False) -> bool:
 	"""Manage installation or removal of packages."""
+	# Resolve the names once, both passes below work on the same packages.
+	pkgs: list[Package] = []
+	for pkg_name in pkg_names:
+		with contextlib.suppress(KeyError):
+			pkgs.append(cache[pkg_name])
+
+	purge = arguments.is_purge()
 	with cache.actiongroup():  # type: ignore[attr-defined]
 		fixer = apt_pkg.ProblemResolver(cache._depcache)
-		for pkg_name in pkg_names:
-			if pkg_name in cache:
-				pkg = cache[pkg_name]
-				try:
-					if remove:
-						if pkg.installed or (
-							pkg.has_config_files and arguments.is_purge()
-						):
-							pkg.mark_delete(
-								auto_fix=arguments.fix_broken,
-								purge=arguments.is_purge(),
-							)
-							dprint(f"Marked Remove: {pkg.name}")
-						continue
-					if not pkg.installed or pkg.marked_downgrade:
-						# Auto_inst is false as we need to do this part later
-						# after all packages have been marked.
-						pkg.mark_install(auto_inst=False, auto_fix=False)
-						fixer.clear(pkg._pkg)
-						fixer.protect(pkg._pkg)
-						dprint(f"Marked Install: {pkg.name}")
-					elif pkg.is_upgradable:
-						pkg.mark_upgrade()
-						dprint(f"Marked upgrade: {pkg.name}")
-				except AptError as error:
-					if (
-						"broken packages" not in f"{error}"
-						and "held packages" not in f"{error}"
-					):
-						raise error from error
-					return False
+		for pkg in pkgs:
+			try:
+				if remove:
+					if pkg.installed or (pkg.has_config_files and purge):
+						pkg.mark_delete(
+							auto_fix=arguments.fix_broken,
+							purge=purge,
+						)
+						dprint(f"Marked Remove: {pkg.name}")
+					continue
+				if not pkg.installed or pkg.marked_downgrade:
+					# Auto_inst is false as we need to do this part later
+					# after all packages have been marked.
+					pkg.mark_install(auto_inst=False, auto_fix=False)
+					fixer.clear(pkg._pkg)
+					fixer.protect(pkg._pkg)
+					dprint(f"Marked Install: {pkg.name}")
+				elif pkg.is_upgradable:
+					pkg.mark_upgrade()
+					dprint(f"Marked upgrade: {pkg.name}")
+			except AptError as error:
+				if (
+					"broken packages" not in f"{error}"
+					and "held packages" not in f"{error}"
+				):
+					raise error from error
+				return False
 	# When installing packages we need to iterate them again and mark them differently
 	# Apt does not do this for removing packages.
 	# https://github.com/volitank/nala/issues/27
 	if not remove:
-		for pkg_name in pkg_names:
-			if pkg_name in cache:
-				pkg = cache[pkg_name]
-				pkg.mark_install(auto_fix=arguments.fix_broken)
+		for pkg in pkgs:
+			pkg.mark_install(auto_fix=arguments.fix_broken)
 	return True
 
 
@@ -1056,15 +1068,18 @@ def check_broken(
 	depcache = cache._depcache
 
 	not_found, failed = set_candidate_versions(pkg_names, cache)
+	fix_broken = arguments.fix_broken
 	with cache.actiongroup():  # type: ignore[attr-defined]
-		for pkg_name in pkg_names[:]:
-			if pkg_name not in cache:
+		for pkg_name in pkg_names:
+			try:
+				pkg = cache[pkg_name]
+			except KeyError:
 				not_found.append(pkg_name)
 				continue
 
-			pkg = cache[pkg_name]
 			mark_pkg(pkg, depcache, remove=remove)
-			if depcache.broken_count > broken_count and arguments.fix_broken:
+			# Only ask the depcache for its count when we will use it.
+			if fix_broken and depcache.broken_count > broken_count:
 				broken.append(pkg)
 				broken_count += 1
 	return broken, not_found, failed
@@ -1084,15 +1099,13 @@ def mark_pkg(pkg: Package, depcache: DepCache, remove: bool = False) -> bool:
 		return True
 
 	# Check the installed version against the candidate version in case we're downgrading or upgrading.
-	if (
-		pkg.installed
-		and pkg.candidate
-		and pkg.installed.version == pkg.candidate.version
-	):
+	installed = pkg.installed
+	candidate = pkg.candidate
+	if installed and candidate and installed.version == candidate.version:
 		print(
 			_("{package} is already at the latest version {version}").format(
 				package=color(pkg.name, "GREEN"),
-				version=color(pkg.installed.version, "BLUE"),
+				version=color(installed.version, "BLUE"),
 			)
 		)
 		return False
@@ -203,18 +203,12 @@ def remove_completion(ctx: typer.Context) -> Generator[str, None, None]:
 	if "purge" in ctx.command_path:
 		regex += r"|config-files"
 
-	status = re.compile(regex)
+	# Search each stanza for its fields instead of splitting every line.
+	status = re.compile(rf"^Status: .*(?:{regex})", re.MULTILINE)
+	package_field = re.compile(r"^Package: (.+)$", re.MULTILINE)
 	for package in DPKG_STATE.read_text(encoding="utf-8").split("\n\n"):
-		pkg_name = pkg_status = None
-		for line in package.splitlines():
-			if len(fields := line.split(": ")) == 1:
-				continue
-			if "Package" in fields:
-				pkg_name = fields[1]
-			if "Status" in fields and status.findall(fields[1]):
-				pkg_status = fields[1]
-		if pkg_name and pkg_status:
-			yield pkg_name
+		if status.search(package) and (pkg_name := package_field.search(package)):
+			yield pkg_name.group(1)
 
 
 def package_completion(cur: str) -> Generator[str, None, None]:
@@ -506,7 +500,9 @@ def search(
 	"""Search package names and descriptions."""
 	cache = Cache()
 	user_installed = (
-		get_list(get_history("Nala"), "User-Installed") if nala_installed else []
+		set(get_list(get_history("Nala"), "User-Installed"))
+		if nala_installed
+		else set()
 	)
 
 	patterns = [
@@ -559,7 +555,9 @@ def list_pkgs(
 	"""List packages based on package names."""
 	cache = Cache()
 	user_installed = (
-		get_list(get_history("Nala"), "User-Installed") if nala_installed else []
+		set(get_list(get_history("Nala"), "User-Installed"))
+		if nala_installed
+		else set()
 	)
 
 	patterns: list[Pattern[str]] = []
@@ -26,7 +26,6 @@ from __future__ import annotations
 
 import os
 import sys
-from pydoc import pager
 from subprocess import run
 from typing import Dict, List, NoReturn, Optional, Union, cast
 
@@ -385,10 +384,12 @@ def print_license(value: bool) -> None:
 	"""Print the GPLv3 with `--license`."""
 	if not value:
 		return
-	if GPL3_LICENSE.exists():
-		with open(GPL3_LICENSE, encoding="utf-8") as file:
-			pager(file.read())
-	else:
+	# pydoc is only needed to page the license, don't import it for every command.
+	from pydoc import pager  # pylint: disable=import-outside-toplevel
+
+	try:
+		pager(GPL3_LICENSE.read_text(encoding="utf-8"))
+	except FileNotFoundError:
 		print(
 			_(
 				"It seems the system has no license file\n"
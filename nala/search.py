@@ -39,7 +39,7 @@ LINE = "│   " if is_utf8 else "|   "
 
 
 def skip_pkg(
-	cache: Cache, pkg: Package, nala_installed: bool, user_installed: list[str]
+	cache: Cache, pkg: Package, nala_installed: bool, user_installed: set[str]
 ) -> bool:
 	"""Check if the package should be skipped based on user switches."""
 	if nala_installed and pkg.shortname not in user_installed:
@@ -66,6 +66,8 @@ LOCK_FILE = None
 YES_NO = _("Y/y N/n").split()
 YES = YES_NO[0].split("/")
 NO = YES_NO[1].split("/")
+# Answers that count as yes, the english letters are always accepted.
+YES_ANSWERS = frozenset((*YES, "Y", "y"))
 
 
 class Terminal:
@@ -77,6 +79,7 @@ class Terminal:
 	STDERR = 2
 
 	# Control Codes
+	ESCAPE = b"\x1b"
 	CURSER_UP = b"\x1b[1A"
 	CURSER_DOWN = b"\x1b[1B"
 	CURSER_FORWARD = b"\x1b[1C"
@@ -333,7 +336,7 @@ def ask(question: str) -> bool:
 			return False
 
 	resp = input(f"{question} [{YES[0]}/{NO[1]}] ").strip()
-	return len(resp) == 0 or resp[0] in (YES[0], YES[1], "Y", "y")
+	return not resp or resp[0] in YES_ANSWERS
 
 
 def unauth_ask(question: str) -> bool:
@@ -436,10 +439,13 @@ def unit_str(val: int) -> str:
 def iter_remove(path: Path) -> None:
 	"""Iterate the directory supplied and remove all files."""
 	vprint(_("Removing files in {dir}").format(dir=path))
-	for file in path.iterdir():
-		if file.is_file():
-			vprint(_("Removed: {filename}").format(filename=file))
-			file.unlink(missing_ok=True)
+	# scandir gives us the file type from the directory entry without a stat per file
+	with os.scandir(path) as entries:
+		for file in entries:
+			if file.is_file():
+				vprint(_("Removed: {filename}").format(filename=file.path))
+				with contextlib.suppress(FileNotFoundError):
+					os.unlink(file.path)
 
 
 def get_version(
@@ -509,11 +515,8 @@ def dedupe_list(original: Iterable[str]) -> list[str]:
 
 	Useful for when we want to maintain the list order and can't use set()
 	"""
-	dedupe = []
-	for item in original:
-		if item not in dedupe:
-			dedupe.append(item)
-	return dedupe
+	# dict keys keep insertion order and membership is a hash lookup
+	return list(dict.fromkeys(original))
 
 
 def vprint(msg: object) -> None: